@@ -0,0 +1,145 @@
+# Authors:
+#   Ojeda Contreras Braulio Melquisedec
+#   Suárez Pérez Juan Pablo
+# Date:
+#   19/10/2026
+
+# Import libraries needed.
+from . import norm, chi2, ksone
+from . import np
+from .instrumentation import active_stage
+from .modular import MAX_MODULUS, addmod, broadcast_parameters, is_supported, mulmod, normalize_values
+from .test_goodness import DEFAULT_BATTERY, TESTS
+
+
+# Mean test per row.
+def _mean_rows(random_array, alpha):
+    n = random_array.shape[1]
+    z_alpha_over_2 = norm.ppf(1 - alpha / 2)
+    sample_mean = random_array.mean(axis=1)
+    lower_limit = 0.5 - z_alpha_over_2 * (1 / (12 * n)) ** 0.5
+    upper_limit = 0.5 + z_alpha_over_2 * (1 / (12 * n)) ** 0.5
+    return (sample_mean >= lower_limit) & (sample_mean <= upper_limit)
+
+
+# Variance test per row.
+def _variance_rows(random_array, alpha):
+    df = random_array.shape[1]
+    var = random_array.var(axis=1, ddof=1)
+    lim_inf = chi2.ppf(alpha / 2, df - 1) / (12 * (df - 1))
+    lim_sup = chi2.ppf(1 - alpha / 2, df - 1) / (12 * (df - 1))
+    return (var >= lim_inf) & (var <= lim_sup)
+
+
+# Chi-Square test per row.
+def _form_rows(random_array, alpha, limits=(0, 0.2, 0.4, 0.6, 0.8, 1.0)):
+    n = random_array.shape[1]
+    FE = n / (len(limits) - 1)
+    C = np.zeros(len(random_array))
+    for i in range(len(limits) - 1):
+        # The last bin includes its upper limit, as np.histogram.
+        upper = random_array <= limits[i + 1] if i == len(limits) - 2 else random_array < limits[i + 1]
+        FO = ((random_array >= limits[i]) & upper).sum(axis=1)
+        C += (FE - FO) ** 2 / FE
+    return C < chi2.ppf(1 - alpha, len(limits) - 1)
+
+
+# Kolmovorov Smirnov test per row.
+def _kolmovorov_smirnov_rows(random_array, alpha):
+    n = random_array.shape[1]
+    frequency = np.arange(1, n + 1) / n
+    dmax = np.abs(frequency - np.sort(random_array, axis=1)).max(axis=1)
+    return dmax < ksone.interval(1 - alpha, n)[1]
+
+
+# Vectorized tests.
+_ROW_TESTS = {
+    'mean': _mean_rows,
+    'variance': _variance_rows,
+    'form': _form_rows,
+    'kolmovorov_smirnov': _kolmovorov_smirnov_rows,
+}
+
+
+# Run the goodness battery per row.
+def run_battery(random_array, tests=None, alpha=0.05):
+    """
+        Goodness battery for every row of a K x n array.
+        The mean, variance, form and Kolmovorov Smirnov tests are computed
+        along the rows at once, the rest of tests are called per row.
+        Arguments:
+            random_array: a numpy array of values.
+            tests: a list of test names or None for the default battery.
+            alpha: a float value.
+        Returns:
+            results: a dict value, test name -> numpy array of K boolean values.
+    """
+    # Default battery.
+    if tests is None:
+        tests = DEFAULT_BATTERY
+    random_array = np.asarray(random_array, dtype=np.float64)
+    results = dict()
+    for name in tests:
+        assert name in TESTS, f'Unknown test \'{name}\'. Try one of {sorted(TESTS)}.'
+        # One stage per test, named as the scalar test.
+        with active_stage(TESTS[name].__name__, values=random_array.size, function=TESTS[name].__name__):
+            if name in _ROW_TESTS:
+                results[name] = _ROW_TESTS[name](random_array, alpha)
+            else:
+                results[name] = np.array([bool(TESTS[name](row, alpha=alpha)) for row in random_array])
+    return results
+
+
+# Batched linear congruence method.
+def congruence_batch(seeds, a, c, m, n, normalized=True, tests=None, alpha=0.05):
+    """
+        Generation of random numbers with K Linear Congruence generators at once.
+        Arguments:
+            seeds: an integer value or a list of K values.
+            a: an integer value or a list of K values.
+            c: an integer value or a list of K values.
+            m: an integer value or a list of K values.
+            n: an integer value.
+            normalized: a boolean value.
+            tests: None, True for the default battery or a list of test names.
+            alpha: a float value.
+        Returns:
+            random_array: a K x n numpy array of values.
+            results: a dict value with the battery results per row, only when tests is given.
+    """
+    # Validation of n.
+    assert n > 0, f'\'n\' is a positive integer value.'
+    # K-wide parameters.
+    seeds, a, c, m = broadcast_parameters(seeds, a, c, m)
+    assert all(value > 0 for value in m), f'\'m\' is a positive integer value.'
+    # Reduction of the parameters, the sequence does not change.
+    seeds, a, c = seeds % m, a % m, c % m
+    # int64 when a * x + c can not overflow.
+    if max(a) * (max(m) - 1) + max(c) < 2 ** 63:
+        seeds, a, c, m = [value.astype(np.int64) for value in (seeds, a, c, m)]
+        step = lambda x_i: (a * x_i + c) % m
+    # Exact uint64 modular kernels for large moduli.
+    elif all(is_supported(value) for value in m) and (len(set(m)) == 1 or max(m) < MAX_MODULUS):
+        # One modulus selects its own reduction strategy.
+        modulus = int(m[0]) if len(set(m)) == 1 else m.astype(np.uint64)
+        seeds, a, c = [value.astype(np.uint64) for value in (seeds, a, c)]
+        step = lambda x_i: addmod(mulmod(a, x_i, modulus), c, modulus)
+    # Exact Python integers otherwise.
+    else:
+        step = lambda x_i: (a * x_i + c) % m
+    # Generation of the K x n values.
+    with active_stage('generation', values=len(seeds) * n, function='congruence_batch'):
+        random_array = np.empty((len(seeds), n), dtype=seeds.dtype)
+        x_i = seeds
+        for i in range(n):
+            # Linear Congruence.
+            x_i = step(x_i)
+            random_array[:, i] = x_i
+    # Normalization.
+    if normalized:
+        with active_stage('normalization', values=len(seeds) * n, function='congruence_batch'):
+            random_array = normalize_values(random_array, m[:, None])
+    # Goodness battery.
+    if tests is not None:
+        return random_array, run_battery(random_array, tests=None if tests is True else tests, alpha=alpha)
+    return random_array
@@ -0,0 +1,232 @@
+# Authors:
+#   Ojeda Contreras Braulio Melquisedec
+#   Suárez Pérez Juan Pablo
+# Date:
+#   19/10/2026
+
+# Import libraries needed.
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from . import np
+from .registry import generate, get_generator
+from .test_goodness import TESTS
+
+
+# Pi estimator.
+def pi_estimator(numbers):
+    """
+        Estimation of pi with the consecutive pairs of values as points.
+        Arguments:
+            numbers: a numpy array of values.
+        Returns:
+            estimator: a float value.
+    """
+    points = np.asarray(numbers)[:len(numbers) // 2 * 2].reshape(-1, 2)
+    return 4 * np.mean((points ** 2).sum(axis=1) <= 1)
+
+
+# Variance estimator.
+def variance_estimator(numbers):
+    """
+        Sample variance.
+        Arguments:
+            numbers: a numpy array of values.
+        Returns:
+            estimator: a float value.
+    """
+    return np.var(numbers, ddof=1)
+
+
+# Available estimators.
+ESTIMATORS = {
+    'pi': pi_estimator,
+    'mean': np.mean,
+    'variance': variance_estimator,
+}
+
+
+# Hash of a JSON value.
+def _hash(value):
+    text = json.dumps(value, sort_keys=True, default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+# Get a test or an estimator.
+def _resolve(item, table):
+    if callable(item):
+        return getattr(item, '__name__', repr(item)), item
+    assert item in table, f'Unknown item \'{item}\'. Try one of {sorted(table)}.'
+    return item, table[item]
+
+
+# Get the tests or the estimators of a spec.
+def _resolve_all(items, table):
+    functions = [_resolve(item, table) for item in items]
+    names = [name for name, _ in functions]
+    assert len(set(names)) == len(names), \
+        f'Duplicated names in {names}. Lambdas are all named \'<lambda>\', try module-level functions.'
+    return functions
+
+
+# Check if a function can be sent to a worker process.
+def _is_picklable(function):
+    try:
+        pickle.dumps(function)
+        return True
+    except (pickle.PicklingError, AttributeError, TypeError):
+        return False
+
+
+# Identity of the code of a function.
+def _source(function):
+    try:
+        return inspect.getsource(function)
+    except (OSError, TypeError):
+        return f'{getattr(function, "__module__", "")}.{getattr(function, "__qualname__", repr(function))}'
+
+
+# Substreams of the tasks.
+def task_params(spec):
+    """
+        Parameters of every task of an experiment.
+        An integer number of tasks uses consecutive substreams of n values,
+        obtained with the jump-ahead of the generator.
+        Arguments:
+            spec: a dict value.
+        Returns:
+            params: a list of dict values.
+    """
+    params = dict(spec['params'])
+    tasks = spec.get('tasks', 1)
+    # Explicit parameters per task.
+    if not isinstance(tasks, int):
+        return [dict(params, **task) for task in tasks]
+    # Jump-ahead substreams.
+    generator = get_generator(spec['generator'])
+    assert tasks == 1 or generator.jump_ahead is not None, \
+        f'Generator \'{spec["generator"]}\' has no jump-ahead. Try a list of parameters per task.'
+    return [params if i == 0 else generator.jump_ahead(params, i * spec['n']) for i in range(tasks)]
+
+
+# Atomic JSON write.
+def _write_json(path, value):
+    temporal = f'{path}.{os.getpid()}.tmp'
+    with open(temporal, 'w') as file:
+        json.dump(value, file, default=lambda o: o.item() if hasattr(o, 'item') else str(o))
+    os.replace(temporal, path)
+
+
+# Task execution.
+def _run_task(task):
+    # Generated values, from the cache when possible.
+    stream_path = task['stream_path']
+    if stream_path is not None and os.path.exists(stream_path):
+        numbers = np.load(stream_path)
+    else:
+        numbers = generate(task['generator'], task['n'], **task['params'])
+        if stream_path is not None:
+            temporal = f'{stream_path}.{os.getpid()}.tmp.npy'
+            np.save(temporal, numbers)
+            os.replace(temporal, stream_path)
+    # Missing tests and estimators.
+    results = list()
+    for kind, name, function, path in task['items']:
+        if kind == 'tests':
+            value = bool(function(numbers, alpha=task['alpha']))
+        else:
+            value = function(numbers)
+            value = value.item() if hasattr(value, 'item') else value
+        if path is not None:
+            _write_json(path, value)
+        results.append((kind, name, value))
+    return results
+
+
+# Experiment runner.
+def run_experiment(spec, workers=None, cache_dir='.simulation_cache', cache_streams=True):
+    """
+        Reproducible experiment runner.
+        Every test and estimator result is cached with a hash of the generator,
+        the parameters of the task, n and the source of the function, so a
+        rerun only computes what changed.
+        Arguments:
+            spec: a dict value with
+                generator: a string value, a registered generator.
+                params: a dict value, the parameters of the generator.
+                n: an integer value.
+                tasks: an integer value or a list of dict values with parameters per task.
+                tests: a list of test names or functions.
+                estimators: a list of estimator names or functions.
+                Functions must have unique names, and must be defined at
+                module level to run in worker processes.
+                alpha: a float value.
+            workers: an integer value, 1 runs the tasks in this process.
+                Lambdas and closures can not be pickled, so the tasks run in
+                this process with a warning.
+            cache_dir: a string value or None to disable the cache.
+            cache_streams: a boolean value, also cache the generated values.
+        Returns:
+            results: a list of dict values, one per task.
+    """
+    # Validation of n.
+    assert spec['n'] > 0, f'\'n\' is a positive integer value.'
+    tests = _resolve_all(spec.get('tests', []), TESTS)
+    estimators = _resolve_all(spec.get('estimators', []), ESTIMATORS)
+    alpha = spec.get('alpha', 0.05)
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+    # Tasks.
+    results = list()
+    pending = list()
+    for i, params in enumerate(task_params(spec)):
+        result = {'task': i, 'params': params, 'tests': dict(), 'estimators': dict()}
+        results.append(result)
+        stream_key = _hash({'generator': spec['generator'], 'params': params, 'n': spec['n']})
+        items = list()
+        for kind, functions in (('tests', tests), ('estimators', estimators)):
+            for name, function in functions:
+                path = None
+                if cache_dir is not None:
+                    key = _hash([stream_key, kind, name, _source(function), alpha if kind == 'tests' else None])
+                    path = os.path.join(cache_dir, f'{key}.json')
+                    # Cached result.
+                    if os.path.exists(path):
+                        with open(path) as file:
+                            result[kind][name] = json.load(file)
+                        continue
+                items.append((kind, name, function, path))
+        if items:
+            stream_path = None
+            if cache_dir is not None and cache_streams:
+                stream_path = os.path.join(cache_dir, f'{stream_key}.npy')
+            pending.append({
+                'index': i,
+                'generator': spec['generator'],
+                'params': params,
+                'n': spec['n'],
+                'alpha': alpha,
+                'items': items,
+                'stream_path': stream_path,
+            })
+    # Functions that can not be sent to worker processes.
+    if workers != 1 and len(pending) > 1:
+        local = [name for name, function in tests + estimators if not _is_picklable(function)]
+        if local:
+            warnings.warn(f'{local} can not be pickled, running the tasks in this process. '
+                          f'Define them at module level to use worker processes.')
+            workers = 1
+    # Execution of the pending tasks.
+    if workers == 1 or len(pending) <= 1:
+        outputs = list(map(_run_task, pending))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outputs = list(executor.map(_run_task, pending))
+    for task, output in zip(pending, outputs):
+        for kind, name, value in output:
+            results[task['index']][kind][name] = value
+    return results
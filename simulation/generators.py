@@ -4,8 +4,12 @@
 # Date:
 #   12/10/2023
 
+# Import libraries needed.
+from .instrumentation import instrumented
+
 
 # Linear congruence method.
+@instrumented('generation')
 def congruence_method(seed, a, c, m, n, normalized=True):
     """
         Generation of random numbers with Linear Congruence Method.
@@ -52,6 +56,7 @@ def congruence_method(seed, a, c, m, n, normalized=True):
 
 
 # Multiplicative congruent method.
+@instrumented('generation')
 def multiplicative_method(seed, a, m, n, normalized=True):
     """
         Generation of random numbers with multiplicative congruent method.
@@ -97,6 +102,7 @@ def multiplicative_method(seed, a, m, n, normalized=True):
 
 
 # Additive congruent method.
+@instrumented('generation')
 def additive_method(seed, c, m, n, normalized=True):
     """
         Generation of random numbers with additive congruent method.
@@ -142,6 +148,7 @@ def additive_method(seed, c, m, n, normalized=True):
 
 
 # RAND method.
+@instrumented('generation')
 def rand(seed, n, normalized=True):
     """
         Generation of random numbers RAND method.
@@ -158,6 +165,7 @@ def rand(seed, n, normalized=True):
 
 
 # RANDU method.
+@instrumented('generation')
 def randu(seed, n, normalized=True):
     """
         Generation of random numbers RANDU method.
@@ -174,6 +182,7 @@ def randu(seed, n, normalized=True):
 
 
 # Congruent quadratic method.
+@instrumented('generation')
 def quadratic_method(seed, a, b, c, m, n, normalized=True):
     """
         Generation of random numbers Congruent quadratic method.
@@ -195,7 +204,7 @@ def quadratic_method(seed, a, b, c, m, n, normalized=True):
     # Get only a unique random value.
     if n == 1:
         # Additive congruent method.
-        x_i = (a * seed ** 2 + b * seed + c) % m
+        x_i = ((a * seed + b) * seed + c) % m
         random_value = x_i
         # Normalization.
         if normalized:
@@ -207,7 +216,7 @@ def quadratic_method(seed, a, b, c, m, n, normalized=True):
     # 'n' iteration.
     for _ in range(n):
         # Congruent quadratic method.
-        x_i = (a * seed ** 2 + b * seed + c) % m
+        x_i = ((a * seed + b) * seed + c) % m
         random_value = x_i
         # Normalization.
         if normalized:
@@ -289,6 +298,7 @@ class LFSR:
 
 
 # Linear Feedback Displacement method.
+@instrumented('generation')
 def lfsr_method(seed, taps, n, num_bits=8, normalized=True):
     """
         Linear Feedback Displacement method.
@@ -334,6 +344,7 @@ def lfsr_method(seed, taps, n, num_bits=8, normalized=True):
 
 
 # Middle Squares method.
+@instrumented('generation')
 def middle_square_method(seed, n, normalized=True):
     """
         Middle Squares method implementation.
@@ -390,6 +401,7 @@ def middle_square_method(seed, n, normalized=True):
 
 
 # Middle Products method.
+@instrumented('generation')
 def middle_products_method(seed, seed_2, n, normalized=True):
     """
         Middle Products method implementation.
@@ -449,6 +461,7 @@ def middle_products_method(seed, seed_2, n, normalized=True):
 
 
 # Constant Multiplier method. 
+@instrumented('generation')
 def constant_multiplier_method(seed, a, n, normalized=True):
     """
         Constant Multiplier method.
@@ -506,6 +519,7 @@ def constant_multiplier_method(seed, a, n, normalized=True):
 
 
 # Blum Blum Shub method.  
+@instrumented('generation')
 def generator_blum_blum_shub(seed, p, q, n, normalized=True):
     """
         Blum Blum Shub method.
@@ -553,6 +567,7 @@ def generator_blum_blum_shub(seed, p, q, n, normalized=True):
 
 
 # Definición del método Mersenne_Twister.
+@instrumented('generation')
 def mersenne_twister(seed, n, normalized = True):
     # Inicialización general
     x_i_2 = x_i_3 = y_i_2 = y_i_3 = seed
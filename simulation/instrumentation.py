@@ -0,0 +1,241 @@
+# Authors:
+#   Ojeda Contreras Braulio Melquisedec
+#   Suárez Pérez Juan Pablo
+# Date:
+#   19/10/2026
+
+# Import libraries needed.
+import functools
+import logging
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+
+
+# Module logger.
+logger = logging.getLogger(__name__)
+# Active profiler, None when the instrumentation is disabled.
+# Context variables keep threads and asyncio tasks apart.
+_active = ContextVar('active_profiler', default=None)
+# Experiment label of the records.
+_experiment = ContextVar('experiment', default='default')
+# Depth of instrumented calls, nested calls are only recorded once.
+_depth = ContextVar('depth', default=0)
+
+
+# Profiler of generation and tests.
+class Profiler:
+    """
+        Collector of timing records.
+        Inital Arguments:
+            callback: a callable value or None, called with every record.
+            log: a boolean value or a logging.Logger value.
+            memory: a boolean value, trace the peak memory increase with tracemalloc.
+        Methods:
+            experiment(self, name)
+            stage(self, name, values=None, function=None)
+            report(self)
+            summary(self)
+    """
+    # Class Initialization.
+    def __init__(self, callback=None, log=False, memory=False):
+        # Fit attributes.
+        self.callback = callback
+        self.logger = logger if log is True else (log or None)
+        self.memory = memory
+        self.records = list()
+
+
+    # Save a record.
+    def _record(self, stage, function, seconds, values, peak):
+        record = {
+            'experiment': _experiment.get(),
+            'stage': stage,
+            'function': function,
+            'seconds': seconds,
+            'values': values,
+            'bytes': peak,
+        }
+        self.records.append(record)
+        if self.callback is not None:
+            self.callback(record)
+        if self.logger is not None:
+            self.logger.debug('%(experiment)s %(stage)s %(function)s: %(seconds).6f s, '
+                              '%(values)s values, %(bytes)s bytes', record)
+
+
+    # Timing of a block.
+    @contextmanager
+    def stage(self, name, values=None, function=None):
+        """
+            Time a block of code as a stage.
+            Arguments:
+                name: a string value.
+                values: an integer value or None.
+                function: a string value or None.
+            Returns:
+                record: a dict value, filled at the end of the block.
+            The 'bytes' of the record is the increase of the traced memory peak
+            during the block, not the total of allocated bytes. tracemalloc is
+            process-wide, so concurrent stages of other threads are included.
+        """
+        # Nested stages are part of the outer one.
+        if _depth.get():
+            yield dict()
+            return
+        token = _depth.set(1)
+        info = {'values': values}
+        # Memory tracing.
+        if self.memory:
+            tracemalloc.reset_peak()
+            start_memory = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            seconds = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1] - start_memory if self.memory else None
+            _depth.reset(token)
+            self._record(name, function or name, seconds, info['values'], peak)
+
+
+    # Experiment labelling.
+    @contextmanager
+    def experiment(self, name):
+        """
+            Label the records of a block of code.
+            Arguments:
+                name: a string value.
+        """
+        token = _experiment.set(name)
+        try:
+            yield self
+        finally:
+            _experiment.reset(token)
+
+
+    # Report.
+    def report(self):
+        """
+            Aggregation of the records per experiment and stage.
+            Returns:
+                report: a dict value, with the stages and the slowest stage per experiment.
+        """
+        report = dict()
+        for record in self.records:
+            experiment = report.setdefault(record['experiment'], {'stages': dict(), 'seconds': 0.0})
+            stage = experiment['stages'].setdefault(
+                record['stage'], {'calls': 0, 'seconds': 0.0, 'values': 0, 'bytes': 0})
+            stage['calls'] += 1
+            stage['seconds'] += record['seconds']
+            stage['values'] += record['values'] or 0
+            stage['bytes'] += record['bytes'] or 0
+            experiment['seconds'] += record['seconds']
+        # Slowest stage and throughput.
+        for experiment in report.values():
+            for stage in experiment['stages'].values():
+                stage['values_per_second'] = stage['values'] / stage['seconds'] if stage['seconds'] else None
+            experiment['slowest'] = max(experiment['stages'], key=lambda k: experiment['stages'][k]['seconds'])
+        return report
+
+
+    # Text summary.
+    def summary(self):
+        """
+            Text table of the report.
+            Returns:
+                text: a string value.
+        """
+        lines = list()
+        for name, experiment in self.report().items():
+            lines.append(f'{name}: {experiment["seconds"]:.6f} s, slowest stage: {experiment["slowest"]}')
+            for stage, values in sorted(experiment['stages'].items(), key=lambda item: -item[1]['seconds']):
+                share = values['seconds'] / experiment['seconds'] if experiment['seconds'] else 0.0
+                lines.append(f'    {stage:<28} {values["calls"]:>6} calls {values["seconds"]:>12.6f} s '
+                             f'{share:>7.1%} {values["values"]:>12} values {values["bytes"]:>12} bytes')
+        return '\n'.join(lines)
+
+
+# Instrumentation context manager.
+@contextmanager
+def profile(callback=None, log=False, memory=False):
+    """
+        Enable the instrumentation inside a block of code.
+        Arguments:
+            callback: a callable value or None, called with every record.
+            log: a boolean value or a logging.Logger value.
+            memory: a boolean value.
+        Returns:
+            profiler: a Profiler value.
+    """
+    # Memory tracing is only stopped when it was started here.
+    start_tracing = memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+    profiler = Profiler(callback=callback, log=log, memory=memory)
+    token = _active.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _active.reset(token)
+        if start_tracing:
+            tracemalloc.stop()
+
+
+# Get the active profiler.
+def active_profiler():
+    """
+        Active profiler.
+        Returns:
+            profiler: a Profiler value or None.
+    """
+    return _active.get()
+
+
+# Stage of the active profiler.
+def active_stage(name, values=None, function=None):
+    """
+        Time a block of code as a stage of the active profiler, if any.
+        Arguments:
+            name: a string value.
+            values: an integer value or None.
+            function: a string value or None.
+        Returns:
+            context: a context manager, yields a dict value.
+    """
+    profiler = _active.get()
+    if profiler is None:
+        return nullcontext(dict())
+    return profiler.stage(name, values=values, function=function)
+
+
+# Instrumentation decorator.
+def instrumented(stage=None):
+    """
+        Record the calls of a function while a profiler is active.
+        Arguments:
+            stage: a string value, the function name when it is None.
+        Returns:
+            decorator: a callable value.
+    """
+    def decorator(function):
+        name = stage or function.__name__
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            profiler = _active.get()
+            # Disabled instrumentation.
+            if profiler is None:
+                return function(*args, **kwargs)
+            with profiler.stage(name, function=function.__name__) as info:
+                result = function(*args, **kwargs)
+                # Values produced, or values tested.
+                if hasattr(result, '__len__'):
+                    info['values'] = len(result)
+                elif args and hasattr(args[0], '__len__'):
+                    info['values'] = len(args[0])
+                else:
+                    info['values'] = 1
+            return result
+        return wrapper
+    return decorator
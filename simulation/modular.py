@@ -0,0 +1,235 @@
+# Authors:
+#   Ojeda Contreras Braulio Melquisedec
+#   Suárez Pérez Juan Pablo
+# Date:
+#   19/10/2026
+
+# Import libraries needed.
+from . import np
+
+
+# Largest supported modulus for general m.
+MAX_MODULUS = 2 ** 63
+
+
+# Broadcast of the parameters.
+def broadcast_parameters(*values):
+    """
+        K-wide copies of the parameters as exact Python integers.
+        Arguments:
+            values: integer values or lists of K values.
+        Returns:
+            arrays: a list of numpy arrays of K object values.
+    """
+    arrays = [np.atleast_1d(np.asarray(value, dtype=object)).ravel() for value in values]
+    return [array.copy() for array in np.broadcast_arrays(*arrays)]
+
+
+# Exact normalization.
+def normalize_values(values, m):
+    """
+        Division of raw values by the modulus, rounded once to float64.
+        A modulus above 2 ** 53 that is not a power of two is not exact as a
+        float, so the division is made with Python integers.
+        Arguments:
+            values: a numpy array of raw values.
+            m: a number value or a numpy array of values, broadcast with values.
+        Returns:
+            values: a numpy array of float64 values.
+    """
+    values = np.asarray(values)
+    for value in np.ravel(m):
+        if isinstance(value, (int, np.integer)) and value > 2 ** 53 and int(value) & (int(value) - 1) != 0:
+            return (values.astype(object) / np.asarray(m, dtype=object)).astype(np.float64)
+    return (values / np.asarray(m, dtype=np.float64)).astype(np.float64)
+
+
+# Supported modulus.
+def is_supported(m):
+    """
+        Check if the kernels support a modulus.
+        Arguments:
+            m: an integer value.
+        Returns:
+            supported: a boolean value.
+    """
+    return 0 < m <= MAX_MODULUS or m == 2 ** 64
+
+
+# Selection of the reduction strategy.
+def select_strategy(m):
+    """
+        Reduction strategy for a modulus.
+        Arguments:
+            m: an integer value.
+        Returns:
+            strategy: a string value, 'mask', 'mersenne', 'direct' or 'split'.
+    """
+    # Validation of m.
+    assert 0 < m <= 2 ** 64, f'\'m\' must be in (0, 2 ** 64].'
+    # Power of two modulus, uint64 products wrap modulo 2 ** 64.
+    if m & (m - 1) == 0:
+        return 'mask'
+    # Mersenne modulus 2 ** k - 1, folding of the high bits.
+    if (m + 1) & m == 0 and m.bit_length() <= 32:
+        return 'mersenne'
+    # The product fits in uint64.
+    if (m - 1) ** 2 < 2 ** 64:
+        return 'direct'
+    # Products split in chunks.
+    assert m <= MAX_MODULUS, f'\'m\' must be a power of two or at most 2 ** 63.'
+    return 'split'
+
+
+# Multiplication split in chunks of the second factor.
+def _mulmod_split(x, y, m, m_bits):
+    # Chunks of s bits: (r << s) and x * chunk fit in 64 bits.
+    assert m_bits < 64, f'\'m\' must be lower than 2 ** 63.'
+    s = 64 - m_bits
+    mask = np.uint64(2 ** s - 1)
+    shift = np.uint64(s)
+    chunks = -(-m_bits // s)
+    result = np.zeros(np.broadcast(x, y, m).shape, dtype=np.uint64)
+    # Horner evaluation from the most significant chunk of y.
+    for i in range(chunks - 1, -1, -1):
+        result = (result << shift) % m
+        chunk = (y >> np.uint64(i * s)) & mask
+        # Both terms are lower than m <= 2 ** 63, the sum fits.
+        result = (result + (x * chunk) % m) % m
+    return result
+
+
+# Modular multiplication kernel.
+def mulmod_kernel(m):
+    """
+        Exact modular multiplication for uint64 arrays with values lower than m.
+        Arguments:
+            m: an integer value.
+        Returns:
+            kernel: a callable value, kernel(x, y) = x * y mod m.
+    """
+    strategy = select_strategy(m)
+    # Power of two modulus.
+    if strategy == 'mask':
+        mask = np.uint64(m - 1)
+        return lambda x, y: (x * y) & mask
+    # Mersenne modulus.
+    if strategy == 'mersenne':
+        k = np.uint64(m.bit_length())
+        m_u = np.uint64(m)
+        def kernel(x, y):
+            product = x * y
+            result = (product & m_u) + (product >> k)
+            return np.where(result >= m_u, result - m_u, result)
+        return kernel
+    # Direct product.
+    m_u = np.uint64(m)
+    if strategy == 'direct':
+        return lambda x, y: (x * y) % m_u
+    # Split product.
+    m_bits = m.bit_length()
+    return lambda x, y: _mulmod_split(x, y, m_u, m_bits)
+
+
+# Modular addition kernel.
+def addmod_kernel(m):
+    """
+        Exact modular addition for uint64 arrays with values lower than m.
+        Arguments:
+            m: an integer value.
+        Returns:
+            kernel: a callable value, kernel(x, y) = x + y mod m.
+    """
+    # Power of two modulus.
+    if m & (m - 1) == 0:
+        mask = np.uint64(m - 1)
+        return lambda x, y: (x + y) & mask
+    # The sum is lower than 2 * m <= 2 ** 64.
+    m_u = np.uint64(m)
+    def kernel(x, y):
+        result = x + y
+        return np.where(result >= m_u, result - m_u, result)
+    return kernel
+
+
+# Modular multiplication.
+def mulmod(x, y, m):
+    """
+        Exact modular multiplication.
+        Arguments:
+            x: an integer value or a numpy array of values lower than m.
+            y: an integer value or a numpy array of values lower than m.
+            m: an integer value or a numpy array of values lower than 2 ** 63.
+        Returns:
+            result: a numpy array of uint64 values.
+    """
+    x = np.asarray(x, dtype=np.uint64)
+    y = np.asarray(y, dtype=np.uint64)
+    # One modulus.
+    if np.ndim(m) == 0:
+        return mulmod_kernel(int(m))(x, y)
+    # One modulus per value.
+    m_max = max(int(value) for value in np.ravel(m))
+    assert m_max < MAX_MODULUS, f'\'m\' must be lower than 2 ** 63.'
+    m = np.asarray(m, dtype=np.uint64)
+    if (m_max - 1) ** 2 < 2 ** 64:
+        return (x * y) % m
+    return _mulmod_split(x, y, m, m_max.bit_length())
+
+
+# Modular addition.
+def addmod(x, y, m):
+    """
+        Exact modular addition.
+        Arguments:
+            x: an integer value or a numpy array of values lower than m.
+            y: an integer value or a numpy array of values lower than m.
+            m: an integer value or a numpy array of values.
+        Returns:
+            result: a numpy array of uint64 values.
+    """
+    x = np.asarray(x, dtype=np.uint64)
+    y = np.asarray(y, dtype=np.uint64)
+    # One modulus.
+    if np.ndim(m) == 0:
+        return addmod_kernel(int(m))(x, y)
+    # One modulus per value.
+    assert max(int(value) for value in np.ravel(m)) <= MAX_MODULUS, f'\'m\' must be at most 2 ** 63.'
+    m = np.asarray(m, dtype=np.uint64)
+    result = x + y
+    return np.where(result >= m, result - m, result)
+
+
+# Linear congruence sequence.
+def affine_sequence(seed, a, c, m, n):
+    """
+        Raw values of the Linear Congruence Method with uint64 arithmetic.
+        The sequence is filled by doubling: x[i + k] = A_k * x[i] + C_k mod m.
+        Arguments:
+            seed: an integer value.
+            a: an integer value.
+            c: an integer value.
+            m: an integer value.
+            n: an integer value.
+        Returns:
+            random_array: a numpy array of uint64 values.
+    """
+    # Validation of n.
+    assert n > 0, f'\'n\' is a positive integer value.'
+    # Kernels for the modulus.
+    multiply = mulmod_kernel(m)
+    add = addmod_kernel(m)
+    a, c = a % m, c % m
+    # First value.
+    random_array = np.empty(n, dtype=np.uint64)
+    random_array[0] = (a * seed + c) % m
+    # Affine map after 'filled' steps.
+    A, C = a, c
+    filled = 1
+    while filled < n:
+        k = min(filled, n - filled)
+        random_array[filled:filled + k] = add(multiply(np.uint64(A), random_array[:k]), np.uint64(C))
+        # Map after 2 * filled steps.
+        A, C = (A * A) % m, (A * C + C) % m
+        filled += k
+    return random_array
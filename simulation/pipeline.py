@@ -0,0 +1,106 @@
+# Authors:
+#   Ojeda Contreras Braulio Melquisedec
+#   Suárez Pérez Juan Pablo
+# Date:
+#   19/10/2026
+
+# Import libraries needed.
+import asyncio
+import contextvars
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from . import np
+from .registry import stream
+
+
+# End of stream mark.
+_END = object()
+
+
+# Blocks of a registered generator.
+def generator_blocks(name, block_size, n_blocks, normalized=True, **params):
+    """
+        Finite stream of blocks of a resumable registered generator.
+        Arguments:
+            name: a string value.
+            block_size: an integer value.
+            n_blocks: an integer value.
+            normalized: a boolean value.
+            params: the parameters of the generator.
+        Returns:
+            blocks: an iterator of numpy arrays.
+    """
+    return islice(stream(name, block_size, normalized=normalized, **params), n_blocks)
+
+
+# Producer.
+async def _produce(blocks, queues, executor):
+    loop = asyncio.get_running_loop()
+    iterator = iter(blocks)
+    while True:
+        # Generation of the next block outside the event loop.
+        # The context of the task keeps the active profiler in the executor.
+        context = contextvars.copy_context()
+        block = await loop.run_in_executor(executor, context.run, next, iterator, _END)
+        if block is _END:
+            break
+        # The same read-only block is shared by every consumer.
+        block = np.asarray(block)
+        block.setflags(write=False)
+        # Backpressure: wait until every consumer has room.
+        for queue in queues:
+            await queue.put(block)
+    for queue in queues:
+        await queue.put(_END)
+
+
+# Consumer.
+async def _consume(queue, consumer, executor):
+    loop = asyncio.get_running_loop()
+    is_coroutine = inspect.iscoroutinefunction(consumer)
+    results = list()
+    while True:
+        block = await queue.get()
+        if block is _END:
+            return results
+        # Coroutines run in the event loop, blocking callables in the executor.
+        if is_coroutine:
+            result = await consumer(block)
+        else:
+            context = contextvars.copy_context()
+            result = await loop.run_in_executor(executor, context.run, consumer, block)
+        results.append(result)
+
+
+# Producer/consumer pipeline.
+async def run_pipeline(blocks, consumers, maxsize=2, executor=None):
+    """
+        Asynchronous pipeline from a block producer to several consumers.
+        Arguments:
+            blocks: an iterable of blocks, for example generator_blocks(...).
+            consumers: a list of callables or coroutine functions receiving a block.
+            maxsize: an integer value, blocks waiting per consumer.
+            executor: a concurrent.futures.ThreadPoolExecutor value or None for the default one.
+                The producer iterator and the context of the task can not be
+                sent to other processes, so process executors are not supported.
+        Returns:
+            results: a list with the list of results of every consumer.
+    """
+    # Validation of maxsize.
+    assert maxsize > 0, f'\'maxsize\' is a positive integer value.'
+    # Validation of executor.
+    assert executor is None or isinstance(executor, ThreadPoolExecutor), \
+        f'\'executor\' must be a ThreadPoolExecutor or None.'
+    queues = [asyncio.Queue(maxsize) for _ in consumers]
+    tasks = [asyncio.ensure_future(_produce(blocks, queues, executor))]
+    tasks += [asyncio.ensure_future(_consume(queue, consumer, executor))
+              for queue, consumer in zip(queues, consumers)]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # A failed stage stops the whole pipeline.
+        for task in tasks:
+            task.cancel()
+        raise
+    return results[1:]
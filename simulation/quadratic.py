@@ -0,0 +1,245 @@
+# Authors:
+#   Ojeda Contreras Braulio Melquisedec
+#   Suárez Pérez Juan Pablo
+# Date:
+#   19/10/2026
+
+# Import libraries needed.
+import functools
+from . import np
+from .batch import run_battery
+from .instrumentation import active_stage
+from .modular import MAX_MODULUS, addmod, broadcast_parameters, is_supported, mulmod, normalize_values
+
+
+# Largest modulus for the table of the functional graph.
+TABLE_LIMIT = 2 ** 20
+
+
+# Vectorized quadratic step.
+def quadratic_step(x, a, b, c, m):
+    """
+        One step of the Congruent quadratic method in Horner form,
+        x -> ((a * x + b) * x + c) mod m.
+        Arguments:
+            x: a numpy array of values lower than m.
+            a: an integer value or a numpy array of values lower than m.
+            b: an integer value or a numpy array of values lower than m.
+            c: an integer value or a numpy array of values lower than m.
+            m: an integer value or a numpy array of values.
+        Returns:
+            x: a numpy array of values.
+    """
+    # Exact Python integers.
+    if np.asarray(x).dtype == object:
+        return ((a * x + b) % m * x + c) % m
+    # uint64 modular kernels.
+    return addmod(mulmod(addmod(mulmod(a, x, m), b, m), x, m), c, m)
+
+
+# Table of the quadratic map.
+def quadratic_table(a, b, c, m):
+    """
+        Image of every value of Z_m.
+        Arguments:
+            a: an integer value.
+            b: an integer value.
+            c: an integer value.
+            m: an integer value.
+        Returns:
+            table: a numpy array of m values.
+    """
+    # Validation of m.
+    assert 0 < m <= TABLE_LIMIT, f'\'m\' must be at most {TABLE_LIMIT}.'
+    return quadratic_step(np.arange(m, dtype=np.uint64), a % m, b % m, c % m, m).astype(np.int64)
+
+
+# Cached table of the quadratic map.
+@functools.lru_cache(maxsize=4)
+def _cached_table(a, b, c, m):
+    table = quadratic_table(a, b, c, m)
+    table.setflags(write=False)
+    return table
+
+
+# Quadratic sequence.
+def quadratic_sequence(seed, a, b, c, m, n):
+    """
+        Raw values of the Congruent quadratic method.
+        When m is small and n is at least 4 * m, the values until the first
+        repeated one are filled by doubling with the table of the map,
+        x[i + k] = T^k(x[i]), and the cycle is tiled up to n values.
+        Otherwise the values are computed in Horner form.
+        Arguments:
+            seed: an integer value.
+            a: an integer value.
+            b: an integer value.
+            c: an integer value.
+            m: an integer value.
+            n: an integer value.
+        Returns:
+            random_array: a numpy array of values.
+    """
+    # Validation of n.
+    assert n > 0, f'\'n\' is a positive integer value.'
+    # Reduction of the parameters, the sequence does not change.
+    a, b, c = a % m, b % m, c % m
+    x_i = ((a * seed + b) * seed + c) % m
+    # Horner form over reduced operands, the doubling costs a few passes over Z_m.
+    if m > TABLE_LIMIT or n < 4 * m:
+        random_list = [x_i]
+        for _ in range(n - 1):
+            x_i = ((a * x_i + b) * x_i + c) % m
+            random_list.append(x_i)
+        return np.array(random_list, dtype=np.uint64 if is_supported(m) else object)
+    # Doubling until a repeated value, there is one in the first m + 1 values.
+    table = _cached_table(a, b, c, m)
+    path = np.array([x_i], dtype=np.int64)
+    power = table
+    while True:
+        values, first = np.unique(path, return_index=True)
+        if len(values) < len(path):
+            break
+        k = min(len(path), m + 1 - len(path))
+        path = np.concatenate([path, power[path[:k]]])
+        # Map after 2 * len(path) steps.
+        power = power[power]
+    # First repeated value, its first position is the start of the cycle.
+    repeated = np.ones(len(path), dtype=bool)
+    repeated[first] = False
+    end = np.argmax(repeated)
+    tail = first[np.searchsorted(values, path[end])]
+    cycle = path[tail:end]
+    indices = np.arange(n - tail) % len(cycle)
+    # Same dtype as the Horner form.
+    return np.concatenate([path[:tail], cycle[indices]]).astype(np.uint64)
+
+
+# Batched quadratic method.
+def quadratic_batch(seeds, a, b, c, m, n, normalized=True, tests=None, alpha=0.05):
+    """
+        Generation of random numbers with K Congruent quadratic generators at once.
+        Arguments:
+            seeds: an integer value or a list of K values.
+            a: an integer value or a list of K values.
+            b: an integer value or a list of K values.
+            c: an integer value or a list of K values.
+            m: an integer value or a list of K values.
+            n: an integer value.
+            normalized: a boolean value.
+            tests: None, True for the default battery or a list of test names.
+            alpha: a float value.
+        Returns:
+            random_array: a K x n numpy array of values.
+            results: a dict value with the battery results per row, only when tests is given.
+    """
+    # Validation of n.
+    assert n > 0, f'\'n\' is a positive integer value.'
+    # K-wide parameters.
+    seeds, a, b, c, m = broadcast_parameters(seeds, a, b, c, m)
+    assert all(value > 0 for value in m), f'\'m\' is a positive integer value.'
+    # Reduction of the parameters, the sequence does not change.
+    seeds, a, b, c = seeds % m, a % m, b % m, c % m
+    # Exact uint64 modular kernels.
+    if all(is_supported(value) for value in m) and (len(set(m)) == 1 or max(m) < MAX_MODULUS):
+        # One modulus selects its own reduction strategy.
+        modulus = int(m[0]) if len(set(m)) == 1 else m.astype(np.uint64)
+        seeds, a, b, c = [value.astype(np.uint64) for value in (seeds, a, b, c)]
+    # Exact Python integers otherwise.
+    else:
+        modulus = m
+    # Generation of the K x n values.
+    with active_stage('generation', values=len(seeds) * n, function='quadratic_batch'):
+        random_array = np.empty((len(seeds), n), dtype=seeds.dtype)
+        x_i = seeds
+        for i in range(n):
+            # Congruent quadratic method.
+            x_i = quadratic_step(x_i, a, b, c, modulus)
+            random_array[:, i] = x_i
+    # Normalization.
+    if normalized:
+        with active_stage('normalization', values=len(seeds) * n, function='quadratic_batch'):
+            random_array = normalize_values(random_array, m[:, None])
+    # Goodness battery.
+    if tests is not None:
+        return random_array, run_battery(random_array, tests=None if tests is True else tests, alpha=alpha)
+    return random_array
+
+
+# Full period conditions.
+def has_full_period(a, b, c, m):
+    """
+        Full period conditions for a power of two modulus m = 2 ** e
+        (Knuth, TAOCP vol. 2, 3.2.2): a even, c odd and b = a + 1 mod 4.
+        Arguments:
+            a: an integer value.
+            b: an integer value.
+            c: an integer value.
+            m: an integer value.
+        Returns:
+            full_period: a boolean value.
+    """
+    # Validation of m.
+    assert m > 1 and m & (m - 1) == 0, f'\'m\' must be a power of two.'
+    # Modulus 2: x -> (a + b) * x + c mod 2.
+    if m == 2:
+        return c % 2 == 1 and (a + b) % 2 == 1
+    return a % 2 == 0 and c % 2 == 1 and (b - a - 1) % 4 == 0
+
+
+# Cycle structure.
+def cycle_structure(a, b, c, m):
+    """
+        Cycle structure of the functional graph x -> a * x ** 2 + b * x + c mod m.
+        Arguments:
+            a: an integer value.
+            b: an integer value.
+            c: an integer value.
+            m: an integer value.
+        Returns:
+            structure: a dict value with
+                cycles: a list of (first value, length) tuples,
+                cycle_id: a numpy array, cycle reached by every seed,
+                tail: a numpy array, steps before the cycle for every seed,
+                period: a numpy array, period of the sequence of every seed,
+                full_period: a boolean value.
+    """
+    table = quadratic_table(a, b, c, m).tolist()
+    cycle_id = [-1] * m
+    tail = [-1] * m
+    walk = [-1] * m
+    cycles = list()
+    for start in range(m):
+        if tail[start] >= 0:
+            continue
+        # Walk until a known value or a value of this walk.
+        path = list()
+        x = start
+        while tail[x] < 0 and walk[x] != start:
+            walk[x] = start
+            path.append(x)
+            x = table[x]
+        # New cycle.
+        if tail[x] < 0:
+            first = path.index(x)
+            cycle = path[first:]
+            for y in cycle:
+                tail[y] = 0
+                cycle_id[y] = len(cycles)
+            cycles.append((x, len(cycle)))
+            path = path[:first]
+        # Tail values.
+        for y in reversed(path):
+            tail[y] = tail[table[y]] + 1
+            cycle_id[y] = cycle_id[table[y]]
+    # Period of every seed.
+    cycle_id = np.array(cycle_id)
+    lengths = np.array([length for _, length in cycles])
+    structure = {
+        'cycles': cycles,
+        'cycle_id': cycle_id,
+        'tail': np.array(tail),
+        'period': lengths[cycle_id],
+        'full_period': len(cycles) == 1 and cycles[0][1] == m,
+    }
+    return structure
@@ -0,0 +1,490 @@
+# Authors:
+#   Ojeda Contreras Braulio Melquisedec
+#   Suárez Pérez Juan Pablo
+# Date:
+#   19/10/2026
+
+# Import libraries needed.
+import math
+from . import np
+from . import generators
+from .instrumentation import active_profiler
+from .modular import affine_sequence, is_supported, normalize_values
+from .quadratic import has_full_period, quadratic_sequence
+
+
+# Registered generators.
+_registry = dict()
+
+
+# Generator specification.
+class GeneratorSpec:
+    """
+        Description of a registered generator.
+        Inital Arguments:
+            name: a string value.
+            function: a callable value, the reference implementation.
+            parameters: a tuple of parameter names (without 'n' and 'normalized').
+            state: a tuple of parameter names that hold the generator state.
+            output_bits: an integer value or a callable value of the params.
+            divisor: a number or a callable value of the params.
+            kernel: a callable value or None, a faster implementation.
+            jump_ahead: a callable value or None.
+            period: a callable value or None.
+            normalizer: a callable value or None.
+            resumable: a boolean value.
+            defaults: a dict value with default parameters.
+        Methods:
+            bits(self, params)
+            normalization_divisor(self, params)
+            period_of(self, params)
+            capabilities(self)
+            normalize(self, values, params)
+    """
+    # Class Initialization.
+    def __init__(self, name, function, parameters, state=('seed',), output_bits=None,
+                 divisor=None, kernel=None, jump_ahead=None, period=None, normalizer=None,
+                 resumable=False, defaults=None):
+        # Fit attributes.
+        self.name = name
+        self.function = function
+        self.parameters = tuple(parameters)
+        self.state = tuple(state)
+        self.state_size = len(self.state)
+        self.output_bits = output_bits
+        self.divisor = divisor
+        self.kernel = kernel
+        self.jump_ahead = jump_ahead
+        self.period = period
+        self.normalizer = normalizer
+        self.resumable = resumable
+        self.defaults = dict() if defaults is None else dict(defaults)
+
+
+    # Representation.
+    def __repr__(self):
+        return f'GeneratorSpec({self.name!r}, parameters={self.parameters}, capabilities={self.capabilities()})'
+
+
+    # Get output bit width.
+    def bits(self, params):
+        """
+            Output bit width.
+            Arguments:
+                params: a dict value.
+            Returns:
+                bits: an integer value or None.
+        """
+        if callable(self.output_bits):
+            return self.output_bits(params)
+        return self.output_bits
+
+
+    # Get normalization divisor.
+    def normalization_divisor(self, params):
+        """
+            Normalization divisor.
+            Arguments:
+                params: a dict value.
+            Returns:
+                divisor: a number or None.
+        """
+        if callable(self.divisor):
+            return self.divisor(params)
+        return self.divisor
+
+
+    # Get period.
+    def period_of(self, params):
+        """
+            Period given by the period formula.
+            Arguments:
+                params: a dict value.
+            Returns:
+                period: an integer value or None when it is unknown.
+        """
+        if self.period is None:
+            return None
+        return self.period(params)
+
+
+    # Get capabilities.
+    def capabilities(self):
+        """
+            Capabilities of the generator.
+            Arguments:
+                self.
+            Returns:
+                capabilities: a tuple of strings.
+        """
+        capabilities = list()
+        if self.kernel is not None:
+            capabilities.append('kernel')
+        if self.jump_ahead is not None:
+            capabilities.append('jump_ahead')
+        if self.period is not None:
+            capabilities.append('period')
+        if self.resumable:
+            capabilities.append('resumable')
+        return tuple(capabilities)
+
+
+    # Normalization.
+    def normalize(self, values, params):
+        """
+            Normalization of raw values.
+            Arguments:
+                values: a numpy array of raw values.
+                params: a dict value.
+            Returns:
+                values: a numpy array of normalized values.
+        """
+        if self.normalizer is not None:
+            return self.normalizer(values, params)
+        return normalize_values(values, self.normalization_divisor(params))
+
+
+# Register a generator.
+def register_generator(name, function, parameters, replace=False, **kwargs):
+    """
+        Register a generator.
+        Arguments:
+            name: a string value.
+            function: a callable value, called as function(**params, n=n, normalized=normalized).
+            parameters: a tuple of parameter names.
+            replace: a boolean value.
+            kwargs: the rest of arguments of GeneratorSpec.
+        Returns:
+            spec: a GeneratorSpec value.
+    """
+    # Name validation.
+    assert replace or name not in _registry, f'Generator \'{name}\' is already registered.'
+    # Build and save the specification.
+    spec = GeneratorSpec(name, function, parameters, **kwargs)
+    _registry[name] = spec
+    return spec
+
+
+# Get a generator.
+def get_generator(name):
+    """
+        Get a registered generator.
+        Arguments:
+            name: a string value.
+        Returns:
+            spec: a GeneratorSpec value.
+    """
+    assert name in _registry, f'Generator \'{name}\' is not registered.'
+    return _registry[name]
+
+
+# Available generators.
+def available_generators():
+    """
+        Names of registered generators.
+        Returns:
+            names: a list of strings.
+    """
+    return sorted(_registry)
+
+
+# Parameters validation.
+def _check_params(spec, params):
+    missing = [p for p in spec.parameters if p not in params]
+    unknown = [p for p in params if p not in spec.parameters]
+    assert not missing, f'Missing parameters for \'{spec.name}\': {missing}.'
+    assert not unknown, f'Unknown parameters for \'{spec.name}\': {unknown}.'
+
+
+# Raw values without loss.
+def _raw_array(values):
+    # Kernels return numpy arrays.
+    if isinstance(values, np.ndarray):
+        return np.atleast_1d(values)
+    # Reference functions return a list, or a value when n is 1.
+    values = list(values) if isinstance(values, (list, tuple)) else [values]
+    array = np.asarray(values)
+    # Integers beyond int64 are turned into float64, keep them exact.
+    if array.dtype != object and array.tolist() != values:
+        array = np.array(values, dtype=object)
+    return array
+
+
+# Generic generation.
+def generate(name, n, normalized=True, **params):
+    """
+        Generation of random numbers with a registered generator, using the
+        fastest available implementation.
+        Arguments:
+            name: a string value.
+            n: an integer value.
+            normalized: a boolean value.
+            params: the parameters of the generator.
+        Returns:
+            random_array: a numpy array of values.
+    """
+    # Get specification.
+    spec = get_generator(name)
+    params = dict(spec.defaults, **params)
+    _check_params(spec, params)
+    # Validation of n.
+    assert n > 0, f'\'n\' is a positive integer value.'
+    # Fastest implementation.
+    function = spec.function if spec.kernel is None else spec.kernel
+    # Disabled instrumentation.
+    profiler = active_profiler()
+    if profiler is None:
+        random_array = _raw_array(function(**params, n=n, normalized=False))
+        if normalized:
+            random_array = spec.normalize(random_array, params)
+        return random_array
+    # Raw values.
+    with profiler.stage('generation', values=n, function=name):
+        random_array = _raw_array(function(**params, n=n, normalized=False))
+    # Normalization.
+    if normalized:
+        with profiler.stage('normalization', values=n, function=name):
+            random_array = spec.normalize(random_array, params)
+    return random_array
+
+
+# Affine map after k steps.
+def _affine_power(a, c, m, k):
+    # x -> A * x + C after k steps, by repeated squaring.
+    A, C = 1, 0
+    a_p, c_p = a % m, c % m
+    while k > 0:
+        if k & 1:
+            A, C = (a_p * A) % m, (a_p * C + c_p) % m
+        a_p, c_p = (a_p * a_p) % m, (a_p * c_p + c_p) % m
+        k >>= 1
+    return A, C
+
+
+# Jump-ahead of congruential generators.
+def _congruence_jump(a, c, m):
+    def jump_ahead(params, k):
+        # Get the parameters.
+        a_p = params.get('a', a)
+        c_p = params.get('c', c)
+        m_p = params.get('m', m)
+        A, C = _affine_power(a_p, c_p, m_p, k)
+        # New state.
+        new_params = dict(params)
+        new_params['seed'] = (A * params['seed'] + C) % m_p
+        return new_params
+    return jump_ahead
+
+
+# uint64 kernel of congruential generators.
+def _congruence_kernel(function, a, c, m):
+    def kernel(seed, n, normalized=False, **params):
+        # Get the parameters.
+        a_p = params.get('a', a)
+        c_p = params.get('c', c)
+        m_p = params.get('m', m)
+        # Moduli out of the uint64 kernels use the reference implementation,
+        # as exact Python integers.
+        if not is_supported(m_p):
+            return np.array(function(seed=seed, **params, n=n, normalized=False), dtype=object)
+        return affine_sequence(seed, a_p, c_p, m_p, n)
+    return kernel
+
+
+# Kernel of the Congruent quadratic method.
+def _quadratic_kernel(seed, a, b, c, m, n, normalized=False):
+    return quadratic_sequence(seed, a, b, c, m, n)
+
+
+# Period of the Congruent quadratic method.
+def _quadratic_period(params):
+    a, b, c, m = params['a'], params['b'], params['c'], params['m']
+    # Only known for power of two moduli.
+    if m > 1 and m & (m - 1) == 0 and has_full_period(a, b, c, m):
+        return m
+    return None
+
+
+# Trial division factorization.
+def _prime_factors(number):
+    factors = list()
+    d = 2
+    while d * d <= number:
+        if number % d == 0:
+            factors.append(d)
+            while number % d == 0:
+                number //= d
+        d += 1 if d == 2 else 2
+    if number > 1:
+        factors.append(number)
+    return factors
+
+
+# Primality by trial division, False when it is too expensive to check.
+def _is_prime(number):
+    return 1 < number < 2 ** 40 and _prime_factors(number) == [number]
+
+
+# Multiplicative order of a modulo a prime m.
+def _multiplicative_order(a, m):
+    # Only small enough primes are factorized.
+    if m >= 2 ** 40 or a % m == 0 or _prime_factors(m) != [m]:
+        return None
+    order = m - 1
+    for p in _prime_factors(m - 1):
+        while order % p == 0 and pow(a, order // p, m) == 1:
+            order //= p
+    return order
+
+
+# Period of the linear congruence method.
+def _congruence_period(params):
+    a, c, m = params['a'], params['c'], params['m']
+    # Multiplicative case.
+    if c % m == 0:
+        return _multiplicative_period(params)
+    # Only power of two or small enough moduli are factorized.
+    if m & (m - 1) == 0:
+        primes = [2]
+    elif m < 2 ** 40:
+        primes = _prime_factors(m)
+    else:
+        return None
+    # Hull-Dobell theorem.
+    if math.gcd(c, m) != 1:
+        return None
+    for p in primes:
+        if (a - 1) % p != 0:
+            return None
+    if m % 4 == 0 and (a - 1) % 4 != 0:
+        return None
+    return m
+
+
+# Period of the multiplicative congruent method.
+def _multiplicative_period(params):
+    a, m, seed = params['a'], params['m'], params['seed']
+    # Power of two modulus.
+    if m >= 16 and m & (m - 1) == 0:
+        if a % 8 in (3, 5) and seed % 2 == 1:
+            return m // 4
+        return None
+    # Prime modulus.
+    if seed % m == 0:
+        return None
+    return _multiplicative_order(a, m)
+
+
+# Period of the additive congruent method.
+def _additive_period(params):
+    return params['m'] // math.gcd(params['c'] % params['m'], params['m'])
+
+
+# Jump-ahead of Blum Blum Shub method.
+def _blum_blum_shub_jump(params, k):
+    # x_k = seed ^ (2 ^ k) mod m, for distinct primes p and q the exponent
+    # is reduced modulo lcm(p - 1, q - 1) when the seed is coprime with m.
+    p, q = params['p'], params['q']
+    m = p * q
+    seed = params['seed']
+    if p != q and _is_prime(p) and _is_prime(q) and math.gcd(seed, m) == 1:
+        carmichael = math.lcm(p - 1, q - 1)
+        seed = pow(seed, pow(2, k, carmichael), m)
+    # Any other p, q or seed, one square per step.
+    else:
+        for _ in range(k):
+            seed = (seed ** 2) % m
+    new_params = dict(params)
+    new_params['seed'] = seed
+    return new_params
+
+
+# Mersenne Twister normalization.
+def _mersenne_normalizer(values, params):
+    return np.where(values > 0, values / 4294967088, 1.0)
+
+
+# Digits of the seed.
+def _digits(params):
+    return len(str(params['seed']))
+
+
+# Registration of the generators.
+register_generator(
+    'congruence', generators.congruence_method, ('seed', 'a', 'c', 'm'),
+    output_bits=lambda p: (p['m'] - 1).bit_length(), divisor=lambda p: p['m'],
+    kernel=_congruence_kernel(generators.congruence_method, None, None, None),
+    jump_ahead=_congruence_jump(None, None, None), period=_congruence_period, resumable=True)
+register_generator(
+    'multiplicative', generators.multiplicative_method, ('seed', 'a', 'm'),
+    output_bits=lambda p: (p['m'] - 1).bit_length(), divisor=lambda p: p['m'],
+    kernel=_congruence_kernel(generators.multiplicative_method, None, 0, None),
+    jump_ahead=_congruence_jump(None, 0, None), period=_multiplicative_period, resumable=True)
+register_generator(
+    'additive', generators.additive_method, ('seed', 'c', 'm'),
+    output_bits=lambda p: (p['m'] - 1).bit_length(), divisor=lambda p: p['m'],
+    kernel=_congruence_kernel(generators.additive_method, 1, None, None),
+    jump_ahead=_congruence_jump(1, None, None), period=_additive_period, resumable=True)
+register_generator(
+    'rand', generators.rand, ('seed',),
+    output_bits=31, divisor=2 ** 31 - 1,
+    kernel=_congruence_kernel(generators.rand, 7 ** 5, 0, 2 ** 31 - 1),
+    jump_ahead=_congruence_jump(7 ** 5, 0, 2 ** 31 - 1),
+    period=lambda p: _multiplicative_period(dict(p, a=7 ** 5, m=2 ** 31 - 1)), resumable=True)
+register_generator(
+    'randu', generators.randu, ('seed',),
+    output_bits=31, divisor=2 ** 31,
+    kernel=_congruence_kernel(generators.randu, 2 ** 16 + 3, 0, 2 ** 31),
+    jump_ahead=_congruence_jump(2 ** 16 + 3, 0, 2 ** 31),
+    period=lambda p: _multiplicative_period(dict(p, a=2 ** 16 + 3, m=2 ** 31)), resumable=True)
+register_generator(
+    'quadratic', generators.quadratic_method, ('seed', 'a', 'b', 'c', 'm'),
+    output_bits=lambda p: (p['m'] - 1).bit_length(), divisor=lambda p: p['m'],
+    kernel=_quadratic_kernel, period=_quadratic_period, resumable=True)
+register_generator(
+    'lfsr', generators.lfsr_method, ('seed', 'taps', 'num_bits'),
+    output_bits=lambda p: p.get('num_bits', 8), divisor=2 ** 8 - 1, defaults={'num_bits': 8})
+register_generator(
+    'middle_square', generators.middle_square_method, ('seed',),
+    output_bits=lambda p: (10 ** _digits(p) - 1).bit_length(), divisor=lambda p: 10 ** _digits(p))
+register_generator(
+    'middle_products', generators.middle_products_method, ('seed', 'seed_2'), state=('seed', 'seed_2'),
+    output_bits=lambda p: (10 ** _digits(p) - 1).bit_length(), divisor=lambda p: 10 ** _digits(p))
+register_generator(
+    'constant_multiplier', generators.constant_multiplier_method, ('seed', 'a'),
+    output_bits=lambda p: (10 ** _digits(p) - 1).bit_length(), divisor=lambda p: 10 ** _digits(p))
+register_generator(
+    'blum_blum_shub', generators.generator_blum_blum_shub, ('seed', 'p', 'q'),
+    output_bits=lambda p: (p['p'] * p['q'] - 1).bit_length(), divisor=lambda p: p['p'] * p['q'],
+    jump_ahead=_blum_blum_shub_jump, resumable=True)
+# The combined generator keeps four internal values that are not parameters,
+# so it can not be resumed from its outputs.
+register_generator(
+    'mersenne_twister', generators.mersenne_twister, ('seed',),
+    output_bits=32, divisor=4294967088, normalizer=_mersenne_normalizer)
+
+
+# Stream of blocks.
+def stream(name, block_size, normalized=True, **params):
+    """
+        Infinite stream of blocks of a resumable generator.
+        Arguments:
+            name: a string value.
+            block_size: an integer value.
+            normalized: a boolean value.
+            params: the parameters of the generator.
+        Returns:
+            blocks: a generator of numpy arrays.
+    """
+    # Get specification.
+    spec = get_generator(name)
+    assert spec.resumable, f'Generator \'{name}\' can not be resumed from its outputs.'
+    assert block_size >= spec.state_size, f'\'block_size\' must be at least {spec.state_size}.'
+    params = dict(spec.defaults, **params)
+    while True:
+        # Raw block.
+        raw = generate(name, block_size, normalized=False, **params)
+        # New state from the last raw values.
+        for key, value in zip(spec.state, raw[-spec.state_size:]):
+            params[key] = int(value)
+        yield spec.normalize(raw, params) if normalized else raw
@@ -7,8 +7,10 @@
 # Import libraries needed.
 from . import norm, chi2, ksone
 from . import np
+from .instrumentation import instrumented
 
 # Mean and distance tests.
+@instrumented()
 def mean_test(numbers, alpha=0.05):
     """
         Mean test.
@@ -19,7 +21,7 @@ def mean_test(numbers, alpha=0.05):
             test: a boolean value.
     """
     # Get sample mean.
-    sample_mean = numbers.mean(ddof=1)
+    sample_mean = np.mean(numbers)
     # Get z.
     z_alpha_over_2 = norm.ppf(1 - alpha / 2)
     # Get limits.
@@ -31,6 +33,7 @@ def mean_test(numbers, alpha=0.05):
 
 
 # Variance test.
+@instrumented()
 def variance_test(numbers, alpha=0.05):
     """
         Variance test.
@@ -56,6 +59,7 @@ def variance_test(numbers, alpha=0.05):
 
 
 # Chi-Square test.
+@instrumented()
 def form_test(numbers, limits=[0, 0.2, 0.4, 0.6, 0.8, 1.0], alpha=0.05):
     """
         Chi-Square test.
@@ -83,6 +87,7 @@ def form_test(numbers, limits=[0, 0.2, 0.4, 0.6, 0.8, 1.0], alpha=0.05):
 
 
 # Kolmovorov Smirnov test.
+@instrumented()
 def kolmovorov_smirnov_test(numbers, alpha=0.05):
     """
         Kolmovorov Smirnov test.
@@ -106,6 +111,7 @@ def kolmovorov_smirnov_test(numbers, alpha=0.05):
 
 
 # Poker test.
+@instrumented()
 def poker_test(numbers, alpha=0.05):
     """
         Poker test.
@@ -234,4 +240,38 @@ def pattern_identifier(random_list, num_consider = 2):
             pos = i
             break
     
-    return pos
\ No newline at end of file
+    return pos
+
+
+# Goodness battery.
+def battery(numbers, tests=None, alpha=0.05):
+    """
+        Goodness battery.
+        Arguments:
+            numbers: a list of values.
+            tests: a list of test names or None for the default battery.
+            alpha: a float value.
+        Returns:
+            results: a dict value, test name -> boolean value.
+    """
+    # Default battery.
+    if tests is None:
+        tests = DEFAULT_BATTERY
+    # Run tests.
+    results = dict()
+    for name in tests:
+        assert name in TESTS, f'Unknown test \'{name}\'. Try one of {sorted(TESTS)}.'
+        results[name] = bool(TESTS[name](numbers, alpha=alpha))
+    return results
+
+
+# Available tests.
+TESTS = {
+    'mean': mean_test,
+    'variance': variance_test,
+    'form': form_test,
+    'kolmovorov_smirnov': kolmovorov_smirnov_test,
+    'poker': poker_test,
+}
+# Default battery.
+DEFAULT_BATTERY = ('mean', 'variance', 'form', 'kolmovorov_smirnov')